@@ -0,0 +1,268 @@
+import os
+import random
+from itertools import islice
+import numpy as np
+from games.base import Game
+from games.connect4 import Connect4
+from games.dominoes import Dominoes, DOMINO_INDEX
+from games.tictactoe import TicTacToe
+from solver import Solver
+
+def encode_tictactoe(game: TicTacToe) -> list[int]:
+    # Pieces of the player to move, then pieces of the opponent
+    current, other = (
+        (game.player, game.opponent) if not (game.turn % 2) else
+        (game.opponent, game.player)
+    )
+    return [
+        int(cell in moves)
+        for moves in (current, other)
+        for cell in range(9)
+    ]
+
+def encode_connect4(game: Connect4) -> list[int]:
+    current, other = (
+        (game.player, game.opponent) if not (game.turn % 2) else
+        (game.opponent, game.player)
+    )
+    return [
+        int(cell in moves)
+        for moves in (current, other)
+        for cell in range(42)
+    ]
+
+def encode_dominoes(game: Dominoes) -> list[int]:
+    # Hands in turn order starting with the player to move
+    features = [0] * (game.n_players * 28 + 14)
+
+    for offset in range(game.n_players):
+        tiles = game.tiles[(game.turn + offset) % game.n_players]
+        for tile in tiles:
+            features[offset * 28 + DOMINO_INDEX[tile] - 1] = 1
+
+    # One hot board ends, all zeros before the first move
+    if len(game.board):
+        ends = game.n_players * 28
+        features[ends + game.board[0][0]] = 1
+        features[ends + 7 + game.board[-1][-1]] = 1
+
+    return features
+
+ENCODERS = {
+    TicTacToe: encode_tictactoe,
+    Connect4: encode_connect4,
+    Dominoes: encode_dominoes,
+}
+
+def encode_position(game: Game) -> list[int]:
+    return ENCODERS[type(game)](game)
+
+
+class NpyWriter:
+    """
+    Appends rows to a .npy file through a memory map,
+    doubling its capacity on disk whenever it fills up.
+    The file is truncated to the written rows on close,
+    so it loads with np.load(path, mmap_mode='r').
+    """
+    def __init__(
+        self,
+        path: str,
+        width: int | None,
+        dtype,
+        capacity: int = 1 << 16
+    ):
+        self.path = path
+        self.shape = () if width is None else (width,)
+        self.dtype = np.dtype(dtype)
+        self.capacity = capacity
+        self.count = 0
+
+        self.file = open(path, 'w+b')
+        self.offset = self._write_header(capacity)
+        self.array = self._map()
+
+    def _write_header(self, rows: int) -> int:
+        self.file.seek(0)
+        np.lib.format.write_array_header_1_0(self.file, {
+            'descr': np.lib.format.dtype_to_descr(self.dtype),
+            'fortran_order': False,
+            'shape': (rows, *self.shape),
+        })
+
+        return self.file.tell()
+
+    def _rewrite_header(self, rows: int) -> None:
+        if self._write_header(rows) != self.offset:
+            raise ValueError('Header size changed, data would be overwritten')
+
+    def _map(self) -> np.memmap:
+        row_size = self.dtype.itemsize * int(np.prod(self.shape))
+        self.file.truncate(self.offset + self.capacity * row_size)
+
+        return np.memmap(
+            self.file,
+            dtype=self.dtype,
+            mode='r+',
+            offset=self.offset,
+            shape=(self.capacity, *self.shape)
+        )
+
+    def _grow(self) -> None:
+        self.array.flush()
+        del self.array
+
+        self.capacity *= 2
+        self._rewrite_header(self.capacity)
+        self.array = self._map()
+
+    def append(self, row) -> None:
+        if self.count == self.capacity:
+            self._grow()
+
+        self.array[self.count] = row
+        self.count += 1
+
+    def close(self) -> None:
+        self.array.flush()
+        del self.array
+
+        row_size = self.dtype.itemsize * int(np.prod(self.shape))
+        self._rewrite_header(self.count)
+        self.file.truncate(self.offset + self.count * row_size)
+        self.file.close()
+
+
+class DatasetWriter:
+    """
+    Streams (encoded position, exact score, best move) records into
+    {prefix}_positions.npy, {prefix}_scores.npy and {prefix}_moves.npy.
+    """
+    def __init__(self, prefix: str, width: int, capacity: int = 1 << 16):
+        directory = os.path.dirname(prefix)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.positions = NpyWriter(f'{prefix}_positions.npy', width, np.int8, capacity)
+        self.scores = NpyWriter(f'{prefix}_scores.npy', None, np.int16, capacity)
+        self.moves = NpyWriter(f'{prefix}_moves.npy', None, np.int8, capacity)
+
+    def __len__(self) -> int:
+        return self.scores.count
+
+    def __enter__(self) -> 'DatasetWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append(self, game: Game, score: int, move: int) -> None:
+        self.positions.append(encode_position(game))
+        self.scores.append(score)
+        self.moves.append(move)
+
+    def close(self) -> None:
+        for writer in (self.positions, self.scores, self.moves):
+            writer.close()
+
+def load_dataset(prefix: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return tuple(
+        np.load(f'{prefix}_{name}.npy', mmap_mode='r')
+        for name in ('positions', 'scores', 'moves')
+    )
+
+
+def _limit_cache(solver: Solver, max_cache_size: int) -> None:
+    # Cached bounds are only an optimization, so they can be dropped
+    caches = (solver.alphas, solver.betas, solver.weak_alphas, solver.weak_betas)
+
+    if sum(len(cache) for cache in caches) > max_cache_size:
+        for cache in caches:
+            cache.clear()
+
+def export_self_play(
+    make_game,
+    prefix: str,
+    n_games: int,
+    solver: Solver | None = None,
+    random_moves: int = 0,
+    epsilon: float = 0.0,
+    max_cache_size: int = 1_000_000
+) -> int:
+    """
+    Solves and records every position of n_games games created by make_game.
+    The first random_moves moves of each game are random, for varied
+    openings, and afterwards a random move is played with probability
+    epsilon instead of the best one.
+    Returns the number of records written.
+    """
+    solver = solver or Solver()
+    width = len(encode_position(make_game()))
+
+    with DatasetWriter(prefix, width) as writer:
+        for _ in range(n_games):
+            game = make_game()
+
+            for _ in range(random_moves):
+                if game.is_over():
+                    break
+                game._play_unchecked(random.choice(game.legal_moves()))
+
+            while not game.is_over():
+                score, move = solver.solve(game)
+                writer.append(game, score, move)
+                _limit_cache(solver, max_cache_size)
+
+                if random.random() < epsilon:
+                    move = random.choice(game.legal_moves())
+                game._play_unchecked(move)
+
+        return len(writer)
+
+def export_enumeration(
+    game: Game,
+    prefix: str,
+    solver: Solver | None = None,
+    max_positions: int | None = None,
+    max_cache_size: int = 1_000_000,
+    max_seen: int = 1_000_000
+) -> int:
+    """
+    Solves and records every distinct position reachable from game,
+    stopping after max_positions records.
+    At most max_seen visited keys are kept, dropping the oldest half
+    when full, so some positions may be recorded more than once.
+    Returns the number of records written.
+    """
+    solver = solver or Solver()
+
+    # Dict as an insertion ordered set, to drop the oldest keys first
+    seen = dict()
+
+    def walk(writer: DatasetWriter) -> None:
+        if game.is_over() or len(writer) == max_positions:
+            return
+
+        # First move of Dominoes has no key, but is never repeated
+        key = game.get_key() if len(game.turn_state) else None
+        if key is not None:
+            if key in seen:
+                return
+            seen[key] = None
+
+            if len(seen) > max_seen:
+                for old_key in list(islice(seen, len(seen) // 2)):
+                    del seen[old_key]
+
+        score, move = solver.solve(game)
+        writer.append(game, score, move)
+        _limit_cache(solver, max_cache_size)
+
+        for move in game.legal_moves():
+            game._play_unchecked(move)
+            walk(writer)
+            game.undo_move()
+
+    with DatasetWriter(prefix, len(encode_position(game))) as writer:
+        walk(writer)
+        return len(writer)
@@ -50,6 +50,14 @@ class Game:
     def play_move(self, move) -> None:
         raise NotImplementedError
     
+    def _play_unchecked(self, move) -> None:
+        """
+        Plays a move without validating it.
+        Meant for the solver, which only plays moves it just generated.
+        Falls back to the validated play_move if not overridden.
+        """
+        self.play_move(move)
+    
     def undo_move(self) -> None:
         raise NotImplementedError
 
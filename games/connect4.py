@@ -1,6 +1,15 @@
 from .base import Game
 from typing import Literal
 
+# Center columns first for better pruning
+MOVE_ORDER = (3, 4, 2, 5, 1, 6, 0)
+
+# Legal moves indexed by the bitmask of full columns
+LEGAL_MOVES = tuple(
+    tuple(col for col in MOVE_ORDER if not (mask >> col) & 1)
+    for mask in range(1 << 7)
+)
+
 class Connect4(Game):
     def __init__(self):
         super().__init__(
@@ -11,6 +20,7 @@ class Connect4(Game):
         self.player = set()
         self.opponent = set()
         self.occurences = [0]*7
+        self.full_columns = 0
         self.turn_state = []
 
     @staticmethod
@@ -87,7 +97,7 @@ class Connect4(Game):
             move = choice + (self.occurences[choice]) * 7
             
             # If next move wins, return score
-            if self.winning_move(moves | {move}, move): 
+            if self.winning_move_after(moves, move): 
                 return self.get_upper_bound() - 1
         
         return None
@@ -99,7 +109,7 @@ class Connect4(Game):
         for choice in self.legal_moves():
             move = choice + (self.occurences[choice]) * 7
             
-            if self.winning_move(moves | {move}, move): 
+            if self.winning_move_after(moves, move): 
                 winning_chance += 1 
             
             # If opponent has at least 2 winning moves, player cannot prevent loss
@@ -108,8 +118,17 @@ class Connect4(Game):
         
         return None
     
-    def legal_moves(self) -> list:
-        return [i for i in [3, 4, 2, 5, 1, 6, 0] if self.occurences[i] < 6]
+    def winning_move_after(self, moves: set, move: int) -> bool:
+        """
+        Checks if playing move would win, without copying moves.
+        """
+        moves.add(move)
+        wins = self.winning_move(moves, move)
+        moves.discard(move)
+        return wins
+
+    def legal_moves(self) -> tuple:
+        return LEGAL_MOVES[self.full_columns]
 
     def valid_move(self, choice: Literal[0, 1, 2, 3, 4, 5, 6]) -> bool:
         return choice in self.legal_moves()
@@ -117,11 +136,16 @@ class Connect4(Game):
     def play_move(self, choice: Literal[0, 1, 2, 3, 4, 5, 6]) -> None:
         assert self.valid_move(choice), 'Invalid move'
         assert not self.is_over(), 'Game is over'
+        self._play_unchecked(choice)
 
+    def _play_unchecked(self, choice: int) -> None:
         # Register move
         self.turn_state.append(choice)
         self.occurences[choice] += 1
 
+        if self.occurences[choice] == 6:
+            self.full_columns |= 1 << choice
+
         move = choice + (self.occurences[choice] - 1) * 7
         moves = self.player if not (self.turn % 2) else self.opponent
         moves.add(move)
@@ -139,6 +163,7 @@ class Connect4(Game):
 
         choice = self.turn_state.pop()
         self.occurences[choice] -= 1
+        self.full_columns &= ~(1 << choice)
 
         move = choice + (self.occurences[choice]) * 7
         moves = self.player if not (self.turn % 2) else self.opponent
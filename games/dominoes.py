@@ -13,6 +13,12 @@ DOMINO_INDEX = {
     for value, key in enumerate(ALL_DOMINOES, start=1)
 }
 
+# Bit of each tile in a compact hand mask
+DOMINO_BIT = {
+    key: 1 << (value - 1)
+    for key, value in DOMINO_INDEX.items()
+}
+
 class Dominoes(Game):
     def __init__(
         self, 
@@ -60,6 +66,27 @@ class Dominoes(Game):
             ]
         )
 
+    def remaining_tiles(self) -> int:
+        return sum(len(tiles) for tiles in self.tiles)
+
+    def get_endgame_key(self) -> int:
+        """
+        Packs hands, board ends and turn into a single integer.
+        Every hand takes 28 bits, each end 3 bits and the turn 2 bits.
+        * Only meant to be called once the board is not empty *
+        """
+        key = 0
+
+        for tiles in self.tiles:
+            mask = 0
+            for tile in tiles:
+                mask |= DOMINO_BIT[tile]
+            key = (key << 28) | mask
+
+        key = (key << 3) | self.board[0][0]
+        key = (key << 3) | self.board[-1][-1]
+        return (key << 2) | self.turn
+
     def is_closed_game(self):
         if len(self.board) < 10:
             return False
@@ -96,7 +123,8 @@ class Dominoes(Game):
             return None
         
         # If you can play your last tile, then you win
-        if len(legal_moves) == 1 and len(self.tiles[self.turn]) == 1:
+        # even if it also closes the game
+        if len(self.tiles[self.turn]) == 1:
             return self.get_upper_bound()
         
         for move in legal_moves:
@@ -128,12 +156,14 @@ class Dominoes(Game):
     
     def evaluate_forced_loss(self):
         next_idx = (self.turn + 1) % self.n_players
-        next_tiles = list(self.tiles[next_idx])
+        next_tiles = self.tiles[next_idx]
         
         # If opponent has more than 1 tile, then there is no forced loss
         if len(next_tiles) > 1:
             return None
         
+        next_tile, = next_tiles
+        
         # Get the best tile to play assuming forced loss exists
         legal_moves = self.legal_moves()
         best_tile_sum = (
@@ -147,7 +177,7 @@ class Dominoes(Game):
 
         # If opponents last tile is compatible with both edge tiles, 
         # then there is a forced loss, and we can return the score
-        if l in next_tiles[0] and r in next_tiles[0]:
+        if l in next_tile and r in next_tile:
             return self.get_lower_bound() + best_tile_sum
         
         # If there is no forced loss, return None
@@ -168,17 +198,13 @@ class Dominoes(Game):
                 for tile in self.tiles[self.turn]
             ]
 
+        l, r = self.board[0][0], self.board[-1][-1]
+        tiles = self.tiles[self.turn]
+
         # Negative index for left compatibility
         # Positive index for right compatibility
-        legal_moves = [
-            -DOMINO_INDEX[tile]
-            for tile in self.tiles[self.turn]
-            if self.board[0][0] in tile
-        ] + [
-            DOMINO_INDEX[tile]
-            for tile in self.tiles[self.turn]
-            if self.board[-1][-1] in tile
-        ]
+        legal_moves = [-DOMINO_INDEX[tile] for tile in tiles if l in tile]
+        legal_moves.extend(DOMINO_INDEX[tile] for tile in tiles if r in tile)
 
         # If no legal moves are available, return 0 (Pass)
         return legal_moves or [0]
@@ -189,7 +215,9 @@ class Dominoes(Game):
     def play_move(self, i: int):
         assert self.valid_move(i), f'Invalid move {i}'
         assert not self.is_over(), 'Game is over'
+        self._play_unchecked(i)
 
+    def _play_unchecked(self, i: int):
         # Player has to pass
         if i == 0:
             self.turn += 1
@@ -206,23 +234,19 @@ class Dominoes(Game):
         self.occurences[tile[1]] += 1
         
         if i < 0:
-            # Sort tile so that it matches with its right neighbor
-            oriented_tile = sorted(
-                tile, 
-                key=lambda x: x == self.board[0][0],
+            # Orient tile so that it matches with its right neighbor
+            oriented_tile = (
+                tile if tile[1] == self.board[0][0] else 
+                (tile[1], tile[0])
             )
 
             self.board.appendleft(oriented_tile)
         else:
             # If its first move, then orientation doesnt matter
-            # Sort tile so that it matches with its left neighbor
-
-            oriented_tile = tile if len(self.board) == 0 else (
-                sorted(
-                    tile, 
-                    key=lambda x: x == self.board[-1][-1],
-                    reverse=True
-                )
+            # Orient tile so that it matches with its left neighbor
+            oriented_tile = (
+                tile if len(self.board) == 0 or tile[0] == self.board[-1][-1] else 
+                (tile[1], tile[0])
             )
 
             self.board.append(oriented_tile)
@@ -231,7 +255,8 @@ class Dominoes(Game):
         if len(self.tiles[self.turn]) == 0:
             self.winner = int((self.turn % 2))
 
-        if self.is_closed_game():
+        # Otherwise a closed game is won by the lowest hand
+        elif self.is_closed_game():
             scores = self.scores
             diff = scores[0] - scores[1]
 
@@ -263,7 +288,10 @@ class Dominoes(Game):
         )
 
         # Return tile to standard representation
-        tile = tuple(sorted(oriented_tile))
+        tile = (
+            oriented_tile if oriented_tile[0] <= oriented_tile[1] else 
+            (oriented_tile[1], oriented_tile[0])
+        )
         self.tiles[self.turn].add(tile)
         self.occurences[tile[0]] -= 1
         self.occurences[tile[1]] -= 1
@@ -1,6 +1,39 @@
+import os
+from array import array
 from typing import Literal
 from .base import Game
 
+WINNING_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6),
+    (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)
+)
+
+# For every cell, the other two cells of each line through it
+WINNING_PAIRS = tuple(
+    tuple(
+        tuple(x for x in line if x != cell)
+        for line in WINNING_LINES
+        if cell in line
+    )
+    for cell in range(9)
+)
+
+# Center first, then corners, then edges
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+# Legal moves indexed by the bitmask of occupied cells
+LEGAL_MOVES = tuple(
+    tuple(cell for cell in MOVE_ORDER if not (mask >> cell) & 1)
+    for mask in range(1 << 9)
+)
+
+# Positions are numbered in base 3: 0 empty, 1 first player, 2 second player
+POWERS = tuple(3 ** cell for cell in range(9))
+N_POSITIONS = 3 ** 9
+
+# Solution table is loaded from here at import if it was saved before
+SOLUTION_PATH = os.path.join(os.path.dirname(__file__), 'tictactoe_solution.bin')
+
 class TicTacToe(Game):
     def __init__(self):
         super().__init__(
@@ -9,18 +42,18 @@ class TicTacToe(Game):
         )
         self.player = set()
         self.opponent = set()
+        self.occupied = 0
+        self.position = 0
         self.turn_state = []
 
     @staticmethod
     def winning_move(moves, last_move):
-        all_moves = list(moves | {last_move})
-
-        winning = (
-            (0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6),
-            (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)
-        )
+        # Only lines through the last move can have been completed
+        for a, b in WINNING_PAIRS[last_move]:
+            if a in moves and b in moves:
+                return True
 
-        return any(all([move in all_moves for move in win]) for win in winning)
+        return False
 
     def get_key(self):
         return tuple([
@@ -44,7 +77,7 @@ class TicTacToe(Game):
         moves = self.player if not (self.turn % 2) else self.opponent
 
         for choice in self.legal_moves():
-            if self.winning_move(moves | {choice}, choice):
+            if self.winning_move(moves, choice):
                 return self.get_upper_bound() - 1
         
         return None
@@ -54,7 +87,7 @@ class TicTacToe(Game):
         winning_chance = 0
 
         for choice in self.legal_moves():
-            if self.winning_move(moves | {choice}, choice): 
+            if self.winning_move(moves, choice): 
                 winning_chance += 1
             
             # If opponent has at least 2 winning moves, player cannot prevent loss
@@ -63,8 +96,8 @@ class TicTacToe(Game):
         
         return None
     
-    def legal_moves(self) -> set:
-        return {0, 1, 2, 3, 4, 5, 6, 7, 8} - (self.player | self.opponent)
+    def legal_moves(self) -> tuple:
+        return LEGAL_MOVES[self.occupied]
 
     def valid_move(self, choice: Literal[0, 1, 2, 3, 4, 5, 6, 7, 8]) -> bool:
         return choice in self.legal_moves()
@@ -72,9 +105,13 @@ class TicTacToe(Game):
     def play_move(self, choice: Literal[0, 1, 2, 3, 4, 5, 6, 7, 8]):
         assert self.valid_move(choice), 'Invalid move'
         assert not self.is_over(), 'Game is over'
+        self._play_unchecked(choice)
 
+    def _play_unchecked(self, choice: int):
         # Register move
         self.turn_state.append(choice)
+        self.occupied |= 1 << choice
+        self.position += POWERS[choice] * (1 + self.turn)
         moves = self.player if not (self.turn % 2) else self.opponent
         moves.add(choice)
 
@@ -90,9 +127,23 @@ class TicTacToe(Game):
         self.winner = None
 
         choice = self.turn_state.pop()
+        self.occupied &= ~(1 << choice)
+        self.position -= POWERS[choice] * (1 + self.turn)
         moves = self.player if not (self.turn % 2) else self.opponent
         moves.discard(choice)
 
+    def get_solution(self) -> tuple[int, int]:
+        """
+        Returns the exact score of the current player and the best move
+        from the solution table, which is built on first use.
+        """
+        scores, moves = get_solution_table()
+        return scores[self.position], moves[self.position]
+
+    def get_move_score(self, choice: int) -> int:
+        scores, _ = get_solution_table()
+        return -scores[self.position + POWERS[choice] * (1 + self.turn)]
+
     def display_board(self):
         board = [[str(i*3 + j) for i in range(3)] for j in range(3)]
 
@@ -105,4 +156,73 @@ class TicTacToe(Game):
 
         for row in range(0, 3):
             print('|\t' + '\t|\t'.join(board[col][row] for col in range(3)) + '\t|')
-            print('-' * 49)
\ No newline at end of file
+            print('-' * 49)
+
+
+_solution_table = None
+
+def build_solution_table() -> tuple[array, array]:
+    """
+    Solves every reachable position with plain negamax.
+    Returns the scores and best moves indexed by position number,
+    with -1 as the move of final and unreachable positions.
+    """
+    scores = array('b', bytes(N_POSITIONS))
+    moves = array('b', [-1]) * N_POSITIONS
+    solved = bytearray(N_POSITIONS)
+    game = TicTacToe()
+
+    def solve() -> int:
+        position = game.position
+        if solved[position]:
+            return scores[position]
+
+        if game.is_over():
+            score = game.compute_final_score()
+        else:
+            score = -game.max_score - 1
+
+            # Ties keep the first move, as the solver does
+            for move in game.legal_moves():
+                game._play_unchecked(move)
+                move_score = -solve()
+                game.undo_move()
+
+                if move_score > score:
+                    score = move_score
+                    moves[position] = move
+
+        scores[position] = score
+        solved[position] = 1
+        return score
+
+    solve()
+    return scores, moves
+
+def get_solution_table() -> tuple[array, array]:
+    global _solution_table
+
+    if _solution_table is None:
+        _solution_table = build_solution_table()
+
+    return _solution_table
+
+def save_solution_table(path: str = SOLUTION_PATH) -> None:
+    scores, moves = get_solution_table()
+
+    with open(path, 'wb') as f:
+        f.write(scores.tobytes())
+        f.write(moves.tobytes())
+
+def load_solution_table(path: str = SOLUTION_PATH) -> None:
+    global _solution_table
+
+    scores, moves = array('b'), array('b')
+    with open(path, 'rb') as f:
+        scores.fromfile(f, N_POSITIONS)
+        moves.fromfile(f, N_POSITIONS)
+
+    _solution_table = scores, moves
+
+if os.path.exists(SOLUTION_PATH):
+    load_solution_table()
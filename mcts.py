@@ -0,0 +1,251 @@
+import math
+import random
+from time import time
+import numpy as np
+from games.base import Game
+from games.connect4 import Connect4
+
+def random_playout(game: Game) -> float:
+    """
+    Plays random moves until the game is over and undoes them.
+    Returns the outcome for the player to move: 1 win, 0 draw, -1 loss.
+    """
+    depth = 0
+
+    while not game.is_over():
+        game._play_unchecked(random.choice(game.legal_moves()))
+        depth += 1
+
+    score = game.compute_final_score()
+    outcome = (score > 0) - (score < 0)
+
+    for _ in range(depth):
+        game.undo_move()
+
+    # Outcome is flipped once for every move played
+    return -outcome if depth % 2 else outcome
+
+
+class Connect4BatchPlayout:
+    """
+    Runs batch_size random playouts at once on vectorized boards.
+    Returns the mean outcome for the player to move.
+    """
+    # Directions checked for a win: vertical, horizontal and diagonals
+    DIRECTIONS = ((1, 0), (0, 1), (1, 1), (1, -1))
+
+    def __init__(self, batch_size: int = 64, seed: int | None = None):
+        self.batch_size = batch_size
+        self.rng = np.random.default_rng(seed)
+
+    def __call__(self, game: Connect4) -> float:
+        n = self.batch_size
+        rows = np.arange(n)
+
+        # Boards are padded by 3 cells on each side to skip bounds checks
+        # 1 marks the player to move and -1 the opponent
+        board = np.zeros((n, 12, 13), dtype=np.int8)
+        current, other = (
+            (game.player, game.opponent) if not (game.turn % 2) else
+            (game.opponent, game.player)
+        )
+
+        for moves, value in ((current, 1), (other, -1)):
+            for move in moves:
+                row, col = move // 7, move % 7
+                board[:, row + 3, col + 3] = value
+
+        heights = np.tile(np.array(game.occurences, dtype=np.int8), (n, 1))
+        outcomes = np.zeros(n, dtype=np.int8)
+        active = np.ones(n, dtype=bool)
+        mover = 1
+
+        for _ in range(42 - len(game.turn_state)):
+            # Random legal column for every board
+            noise = self.rng.random((n, 7))
+            noise[heights >= 6] = -1
+            cols = noise.argmax(axis=1)
+            row_idx = heights[rows, cols].astype(np.intp)
+
+            board[rows[active], row_idx[active] + 3, cols[active] + 3] = mover
+            heights[rows[active], cols[active]] += 1
+
+            wins = np.zeros(n, dtype=bool)
+            for dr, dc in self.DIRECTIONS:
+                count = np.zeros(n, dtype=np.int8)
+
+                for sign in (1, -1):
+                    consecutive = np.ones(n, dtype=bool)
+                    for k in range(1, 4):
+                        cell = board[
+                            rows,
+                            row_idx + 3 + sign * k * dr,
+                            cols + 3 + sign * k * dc
+                        ]
+                        consecutive &= cell == mover
+                        count += consecutive
+
+                wins |= count >= 3
+
+            wins &= active
+            outcomes[wins] = mover
+            active &= ~wins
+            mover = -mover
+
+            if not active.any():
+                break
+
+        return float(outcomes.mean())
+
+
+class Node:
+    __slots__ = ('move', 'parent', 'children', 'untried', 'visits', 'value')
+
+    def __init__(self, move, parent, untried: list):
+        self.move = move
+        self.parent = parent
+        self.children = dict()
+        self.untried = untried
+        self.visits = 0
+
+        # Accumulated outcome for the player that moved into this node
+        self.value = 0.0
+
+    def select(self, exploration: float) -> 'Node':
+        log_visits = math.log(self.visits)
+
+        return max(
+            self.children.values(),
+            key=lambda child: (
+                child.value / child.visits +
+                exploration * math.sqrt(log_visits / child.visits)
+            )
+        )
+
+
+class MCTS:
+    def __init__(
+        self,
+        verbose=False,
+        playouts=1000,
+        time_limit=math.inf,
+        exploration=math.sqrt(2),
+        playout_policy=random_playout,
+        reuse_tree=True
+    ):
+        self.verbose = verbose
+        self.playouts = playouts
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.playout_policy = playout_policy
+        self.reuse_tree = reuse_tree
+        self.playout_count = 0
+
+        self.root = None
+        self.game = None
+        self.history = []
+
+    @staticmethod
+    def new_node(move, parent, game: Game) -> Node:
+        # Reversed so that moves are expanded in the games preferred order
+        untried = [] if game.is_over() else list(game.legal_moves())[::-1]
+        return Node(move, parent, untried)
+
+    def get_root(self, game: Game) -> Node:
+        """
+        Reuses the subtree of the last search if the game only
+        advanced since then, otherwise starts a new tree.
+        """
+        n = len(self.history)
+        turn_state = game.turn_state
+
+        if (
+            self.reuse_tree and
+            self.root is not None and
+            self.game is game and
+            turn_state[:n] == self.history
+        ):
+            node = self.root
+            for move in turn_state[n:]:
+                node = node.children.get(move)
+                if node is None:
+                    break
+
+            if node is not None:
+                node.parent = None
+                return node
+
+        return self.new_node(None, None, game)
+
+    def simulate(self, root: Node, game: Game) -> None:
+        node = root
+        depth = 0
+
+        # Selection
+        while not node.untried and node.children:
+            node = node.select(self.exploration)
+            game._play_unchecked(node.move)
+            depth += 1
+
+        # Expansion
+        if node.untried:
+            move = node.untried.pop()
+            game._play_unchecked(move)
+            depth += 1
+
+            child = self.new_node(move, node, game)
+            node.children[move] = child
+            node = child
+
+        # Simulation, from the perspective of the player to move
+        if game.is_over():
+            score = game.compute_final_score()
+            outcome = (score > 0) - (score < 0)
+        else:
+            outcome = self.playout_policy(game)
+            self.playout_count += getattr(self.playout_policy, 'batch_size', 1)
+
+        for _ in range(depth):
+            game.undo_move()
+
+        # Backpropagation, flipping perspective at every level
+        while node is not None:
+            outcome = -outcome
+            node.visits += 1
+            node.value += outcome
+            node = node.parent
+
+    def get_best_move(self, game: Game):
+        start_time = time()
+        initial_playout_count = self.playout_count
+
+        root = self.get_root(game)
+        for _ in range(self.playouts):
+            self.simulate(root, game)
+
+            if time() - start_time >= self.time_limit:
+                break
+
+        if self.verbose:
+            for move, child in root.children.items():
+                print(
+                    f'Move: {move} | Visits: {child.visits}'
+                    f' | Value: {child.value / child.visits:.3f}'
+                )
+
+        best_move = max(
+            root.children.values(),
+            key=lambda child: child.visits
+        ).move
+
+        self.root = root
+        self.game = game
+        self.history = list(game.turn_state)
+
+        search_time = time() - start_time
+        playouts = self.playout_count - initial_playout_count
+
+        print(f'{playouts} playouts in {search_time:.6f} seconds')
+        print(f'Playouts per second: {playouts / search_time:.0f}')
+
+        return best_move
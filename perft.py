@@ -0,0 +1,97 @@
+from time import time
+from games import Connect4, Dominoes, TicTacToe
+from games.base import Game
+
+# Deals from tests.ipynb
+DOMINOES_DEALS = [
+    [
+        {(0, 4), (1, 4), (2, 3), (3, 5), (3, 6), (4, 6), (5, 5)},
+        {(0, 3), (1, 1), (1, 2), (1, 3), (1, 6), (2, 5), (2, 6)},
+        {(0, 0), (0, 5), (0, 6), (3, 4), (4, 4), (4, 5), (5, 6)},
+        {(0, 1), (0, 2), (1, 5), (2, 2), (2, 4), (3, 3), (6, 6)}
+    ],
+    [
+        {(0, 1), (1, 5), (2, 2), (2, 4), (4, 5), (5, 5), (6, 6)},
+        {(0, 0), (0, 4), (1, 1), (1, 6), (2, 6), (3, 5), (5, 6)},
+        {(0, 3), (1, 4), (2, 3), (3, 3), (3, 6), (4, 4), (4, 6)},
+        {(0, 2), (0, 5), (0, 6), (1, 2), (1, 3), (2, 5), (3, 4)}
+    ],
+]
+
+def dominoes_deal(i: int):
+    return lambda: Dominoes(tiles=[set(tiles) for tiles in DOMINOES_DEALS[i]])
+
+# Leaf nodes at every depth from the starting position
+# Dominoes counts were computed with the original set/deque implementation
+KNOWN_PERFT = {
+    'tictactoe': (TicTacToe, [
+        1, 9, 72, 504, 3024, 15120, 54720, 148176, 200448, 127872
+    ]),
+    'connect4': (Connect4, [
+        1, 7, 49, 343, 2401, 16807, 117649, 823536, 5673234, 39394572
+    ]),
+    'dominoes_0': (dominoes_deal(0), [
+        1, 7, 21, 62, 191, 595, 1723, 4485, 11692, 28790, 73618, 160448, 354504
+    ]),
+    'dominoes_1': (dominoes_deal(1), [
+        1, 7, 25, 76, 268, 680, 1873, 5343, 16477, 35752, 82433, 190450, 490351
+    ]),
+}
+
+def perft(game: Game, depth: int) -> int:
+    """
+    Counts the positions reached after exactly depth moves.
+    Games that end earlier don't count as leaves.
+    """
+    if depth == 0:
+        return 1
+
+    if game.is_over():
+        return 0
+
+    nodes = 0
+    for move in game.legal_moves():
+        game._play_unchecked(move)
+        nodes += perft(game, depth - 1)
+        game.undo_move()
+
+    return nodes
+
+def benchmark(game: Game, depth: int) -> int:
+    start_time = time()
+    nodes = perft(game, depth)
+    search_time = time() - start_time
+
+    print(f'Depth {depth}: {nodes} nodes in {search_time:.6f} seconds')
+    print(f'Nodes per second: {nodes / search_time:.0f}')
+
+    return nodes
+
+def check(name: str, max_depth: int | None = None) -> bool:
+    """
+    Compares perft counts of a known position up to max_depth.
+    """
+    make_game, counts = KNOWN_PERFT[name]
+    depths = range(len(counts) if max_depth is None else max_depth + 1)
+
+    for depth in depths:
+        nodes = perft(make_game(), depth)
+        if nodes != counts[depth]:
+            print(f'{name} depth {depth}: expected {counts[depth]}, got {nodes}')
+            return False
+
+    return True
+
+if __name__ == '__main__':
+    for name, max_depth in [
+        ('tictactoe', 9),
+        ('connect4', 7),
+        ('dominoes_0', 10),
+        ('dominoes_1', 10),
+    ]:
+        print(f'\n{name}')
+        make_game, counts = KNOWN_PERFT[name]
+
+        nodes = benchmark(make_game(), max_depth)
+        status = 'OK' if nodes == counts[max_depth] else 'MISMATCH'
+        print(f'Expected: {counts[max_depth]} {status}')
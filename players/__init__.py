@@ -1,9 +1,9 @@
-from .connect4 import Connect4Player, Connect4AI
-from .dominoes import DominoesPlayer, DominoesAI
-from .tictactoe import TicTacToePlayer, TicTacToeAI
+from .connect4 import Connect4Player, Connect4AI, Connect4MCTS
+from .dominoes import DominoesPlayer, DominoesAI, DominoesMCTS
+from .tictactoe import TicTacToePlayer, TicTacToeAI, TicTacToeMCTS
 
 __all__ = [
-    'Connect4Player', 'Connect4AI',
-    'DominoesPlayer', 'DominoesAI',
-    'TicTacToePlayer', 'TicTacToeAI',
+    'Connect4Player', 'Connect4AI', 'Connect4MCTS',
+    'DominoesPlayer', 'DominoesAI', 'DominoesMCTS',
+    'TicTacToePlayer', 'TicTacToeAI', 'TicTacToeMCTS',
 ]
\ No newline at end of file
@@ -1,6 +1,7 @@
 from .base import Player
 from games.connect4 import Connect4
 from solver import Solver
+from mcts import MCTS, Connect4BatchPlayout
 from typing import Optional
 
 class Connect4Player(Player):
@@ -32,4 +33,25 @@ class Connect4AI(Player):
         )
 
     def choose_move(self, game: Connect4) -> int:
-        return self.solver.get_best_move(game)
\ No newline at end of file
+        return self.solver.get_best_move(game)
+
+
+class Connect4MCTS(Player):
+    def __init__(
+        self, 
+        name: Optional[str] = None,
+        verbose: bool = False,
+        playouts: int = 1000,
+        time_limit: float = float('inf'),
+        batch_size: int = 64
+    ):
+        super().__init__(name or 'Connect4 MCTS')
+        self.mcts = MCTS(
+            verbose=verbose, 
+            playouts=playouts,
+            time_limit=time_limit,
+            playout_policy=Connect4BatchPlayout(batch_size)
+        )
+
+    def choose_move(self, game: Connect4) -> int:
+        return self.mcts.get_best_move(game)
\ No newline at end of file
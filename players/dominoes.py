@@ -1,6 +1,8 @@
 from .base import Player
 from games.dominoes import Dominoes
 from solver import Solver
+from mcts import MCTS
+from tablebase import EndgameTablebase
 from typing import Optional
 
 class DominoesPlayer(Player):
@@ -24,14 +26,36 @@ class DominoesAI(Player):
         self, 
         name: Optional[str] = None,
         verbose: bool = False,
-        max_depth: int = 10
+        max_depth: int = 10,
+        tablebase: Optional[EndgameTablebase] = None
     ):
         super().__init__(name or 'Dominoes AI')
         self.solver = Solver(
             verbose=verbose, 
-            max_depth=max_depth
+            max_depth=max_depth,
+            tablebase=tablebase
         )
 
     def choose_move(self, game: Dominoes) -> int:
         game.display_legal_moves()
-        return self.solver.get_best_move(game)
\ No newline at end of file
+        return self.solver.get_best_move(game)
+
+
+class DominoesMCTS(Player):
+    def __init__(
+        self, 
+        name: Optional[str] = None,
+        verbose: bool = False,
+        playouts: int = 1000,
+        time_limit: float = float('inf')
+    ):
+        super().__init__(name or 'Dominoes MCTS')
+        self.mcts = MCTS(
+            verbose=verbose, 
+            playouts=playouts,
+            time_limit=time_limit
+        )
+
+    def choose_move(self, game: Dominoes) -> int:
+        game.display_legal_moves()
+        return self.mcts.get_best_move(game)
\ No newline at end of file
@@ -1,6 +1,7 @@
 from .base import Player
 from games.tictactoe import TicTacToe
 from solver import Solver
+from mcts import MCTS
 from typing import Optional
 
 class TicTacToePlayer(Player):
@@ -22,10 +23,40 @@ class TicTacToeAI(Player):
     def __init__(
         self, 
         name: Optional[str] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        use_table: bool = True
     ):
         super().__init__(name or 'TicTacToe AI')
+        self.verbose = verbose
+        self.use_table = use_table
         self.solver = Solver(verbose=verbose)
 
     def choose_move(self, game: TicTacToe) -> int:
-        return self.solver.get_best_move(game)
\ No newline at end of file
+        if not self.use_table:
+            return self.solver.get_best_move(game)
+
+        if self.verbose:
+            for move in game.legal_moves():
+                print(f'Move: {move} | Scored: {game.get_move_score(move)}')
+
+        _, move = game.get_solution()
+        return move
+
+
+class TicTacToeMCTS(Player):
+    def __init__(
+        self, 
+        name: Optional[str] = None,
+        verbose: bool = False,
+        playouts: int = 1000,
+        time_limit: float = float('inf')
+    ):
+        super().__init__(name or 'TicTacToe MCTS')
+        self.mcts = MCTS(
+            verbose=verbose, 
+            playouts=playouts,
+            time_limit=time_limit
+        )
+
+    def choose_move(self, game: TicTacToe) -> int:
+        return self.mcts.get_best_move(game)
\ No newline at end of file
@@ -0,0 +1,140 @@
+import marshal
+from collections import defaultdict
+from time import perf_counter
+from games.base import Game
+
+HOT_METHODS = (
+    'get_key',
+    'is_over',
+    'compute_final_score',
+    'evaluate_immediate_win',
+    'evaluate_forced_loss',
+    'legal_moves',
+    'play_move',
+    '_play_unchecked',
+    'undo_move',
+)
+
+class GameProfiler:
+    """
+    Records call counts and times of the hot methods of a game instance.
+    Methods are only wrapped inside the with block, so the game runs
+    at full speed whenever profiling is off.
+
+    with GameProfiler(game) as profiler:
+        solver.get_best_move(game)
+
+    profiler.print_report()
+    """
+    def __init__(self, game: Game, methods: tuple[str, ...] = HOT_METHODS):
+        self.game = game
+        self.methods = methods
+
+        # Per method: calls, cumulative time, own time (without nested calls)
+        self.stats = defaultdict(lambda: [0, 0.0, 0.0])
+
+        # Per (caller, method): same stats, to rebuild the call graph
+        self.callers = defaultdict(lambda: [0, 0.0, 0.0])
+
+        # Own time per call stack, for flamegraphs
+        self.stacks = defaultdict(float)
+
+        self._path = []
+        self._nested = []
+
+    def __enter__(self) -> 'GameProfiler':
+        for name in self.methods:
+            setattr(self.game, name, self._wrap(name, getattr(self.game, name)))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        # Removing the instance attributes restores the class methods
+        for name in self.methods:
+            delattr(self.game, name)
+
+    def _wrap(self, name: str, method):
+        path, nested = self._path, self._nested
+
+        def wrapper(*args, **kwargs):
+            path.append(name)
+            nested.append(0.0)
+            start = perf_counter()
+
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                own = elapsed - nested.pop()
+                stack = tuple(path)
+                path.pop()
+
+                if nested:
+                    nested[-1] += elapsed
+
+                for stats in (
+                    self.stats[name],
+                    self.callers[path[-1] if path else None, name]
+                ):
+                    stats[0] += 1
+                    stats[1] += elapsed
+                    stats[2] += own
+
+                self.stacks[stack] += own
+
+        return wrapper
+
+    def report(self) -> str:
+        lines = [
+            f'{"method":<24}{"calls":>12}{"cumtime (s)":>14}'
+            f'{"owntime (s)":>14}{"mean (us)":>12}'
+        ]
+
+        for name, (calls, cumtime, owntime) in sorted(
+            self.stats.items(),
+            key=lambda item: item[1][2],
+            reverse=True
+        ):
+            lines.append(
+                f'{name:<24}{calls:>12}{cumtime:>14.6f}'
+                f'{owntime:>14.6f}{cumtime / calls * 1e6:>12.2f}'
+            )
+
+        return '\n'.join(lines)
+
+    def print_report(self) -> None:
+        print(self.report())
+
+    def _label(self, name: str) -> tuple[str, int, str]:
+        code = getattr(type(self.game), name).__code__
+        return (code.co_filename, code.co_firstlineno, name)
+
+    def dump_stats(self, path: str) -> None:
+        """
+        Writes the stats in the cProfile format, readable by pstats,
+        snakeviz or any other cProfile viewer.
+        """
+        stats = {}
+
+        for name, (calls, cumtime, owntime) in self.stats.items():
+            callers = {
+                self._label(caller): (n, n, own, cum)
+                for (caller, callee), (n, cum, own) in self.callers.items()
+                if callee == name and caller is not None
+            }
+
+            stats[self._label(name)] = (calls, calls, owntime, cumtime, callers)
+
+        with open(path, 'wb') as f:
+            marshal.dump(stats, f)
+
+    def dump_folded(self, path: str) -> None:
+        """
+        Writes own time per call stack in microseconds, using the
+        folded format read by flamegraph.pl, speedscope or inferno.
+        """
+        prefix = type(self.game).__name__
+
+        with open(path, 'w') as f:
+            for stack, own in self.stacks.items():
+                frames = ';'.join(f'{prefix}.{name}' for name in stack)
+                f.write(f'{frames} {round(own * 1e6)}\n')
@@ -0,0 +1,209 @@
+import math
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
+from time import monotonic
+from games import Connect4, Dominoes, TicTacToe
+from games.base import Game
+from solver import Solver
+
+# Game factory and solver max depth per game type, as in the AI players
+GAME_TYPES = {
+    'tictactoe': (TicTacToe, math.inf),
+    'connect4': (Connect4, 10),
+    'dominoes': (Dominoes, 10),
+}
+
+class SolverPool:
+    """
+    Leases solvers of a single game type.
+    All solvers share one cache, so every lease starts warm.
+    """
+    def __init__(self, max_workers: int = 4, **solver_kwargs):
+        self.max_workers = max_workers
+        self.solver_kwargs = solver_kwargs
+
+        shared = Solver(**solver_kwargs)
+        self.caches = (
+            shared.alphas, shared.betas,
+            shared.weak_alphas, shared.weak_betas
+        )
+        self.idle = [shared]
+        self.n_workers = 1
+        self.condition = threading.Condition()
+
+    def new_solver(self) -> Solver:
+        solver = Solver(**self.solver_kwargs)
+        (
+            solver.alphas, solver.betas,
+            solver.weak_alphas, solver.weak_betas
+        ) = self.caches
+        return solver
+
+    @contextmanager
+    def lease(self):
+        with self.condition:
+            while not self.idle and self.n_workers >= self.max_workers:
+                self.condition.wait()
+
+            if self.idle:
+                solver = self.idle.pop()
+            else:
+                solver = self.new_solver()
+                self.n_workers += 1
+
+        try:
+            yield solver
+        finally:
+            with self.condition:
+                self.idle.append(solver)
+                self.condition.notify()
+
+    def cache_size(self) -> int:
+        return sum(len(cache) for cache in self.caches)
+
+    def evict(self, n_entries: int) -> None:
+        """
+        Drops about n_entries of the oldest cached bounds.
+        Dicts keep insertion order, so the first keys are the coldest.
+        Safe while solvers are leased, since they only probe with get.
+        """
+        with self.condition:
+            total = self.cache_size()
+            if total == 0:
+                return
+
+            for cache in self.caches:
+                n = math.ceil(n_entries * len(cache) / total)
+
+                try:
+                    keys = list(islice(cache, n))
+                except RuntimeError:
+                    # A leased solver inserted while copying, retry next time
+                    continue
+
+                for key in keys:
+                    cache.pop(key, None)
+
+
+class Session:
+    def __init__(self, game_type: str, game: Game):
+        self.game_type = game_type
+        self.game = game
+        self.lock = threading.Lock()
+        self.last_used = monotonic()
+
+
+class SessionManager:
+    """
+    Keeps the game of every session and answers moves with solvers
+    leased from one pool per game type.
+
+    Sessions idle for longer than idle_timeout seconds, or beyond
+    max_sessions, are evicted least recently used first. Cached bounds
+    of all pools are trimmed, coldest first, to max_cache_entries.
+    """
+    def __init__(
+        self,
+        max_sessions: int = 10_000,
+        idle_timeout: float = 30 * 60,
+        max_cache_entries: int = 5_000_000,
+        max_workers: int = 4
+    ):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_cache_entries = max_cache_entries
+
+        self.sessions = OrderedDict()
+        self.lock = threading.Lock()
+        self.pools = {
+            game_type: SolverPool(max_workers=max_workers, max_depth=max_depth)
+            for game_type, (_, max_depth) in GAME_TYPES.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def create(self, session_id, game_type: str, **game_kwargs) -> Game:
+        assert game_type in GAME_TYPES, f'Unknown game type {game_type}'
+
+        make_game, _ = GAME_TYPES[game_type]
+        session = Session(game_type, make_game(**game_kwargs))
+
+        with self.lock:
+            self.sessions[session_id] = session
+            self.sessions.move_to_end(session_id)
+            self.evict_sessions()
+
+        return session.game
+
+    def get(self, session_id) -> Session:
+        with self.lock:
+            assert session_id in self.sessions, f'Unknown session {session_id}'
+
+            session = self.sessions[session_id]
+            session.last_used = monotonic()
+            self.sessions.move_to_end(session_id)
+            self.evict_sessions()
+
+        return session
+
+    def close(self, session_id) -> None:
+        with self.lock:
+            self.sessions.pop(session_id, None)
+
+    def play(self, session_id, move) -> Game:
+        session = self.get(session_id)
+
+        with session.lock:
+            session.game.play_move(move)
+
+        return session.game
+
+    def best_move(self, session_id, weak: bool = False):
+        session = self.get(session_id)
+        pool = self.pools[session.game_type]
+
+        with session.lock, pool.lease() as solver:
+            solver.weak = weak
+            _, move = solver.solve(session.game)
+
+        self.evict_cache()
+        return move
+
+    def evict_sessions(self) -> None:
+        """
+        Drops idle sessions, then the least recently used ones
+        over max_sessions. Expects self.lock to be held.
+        """
+        now = monotonic()
+
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+
+            if (
+                len(self.sessions) <= self.max_sessions and
+                now - session.last_used <= self.idle_timeout
+            ):
+                break
+
+            del self.sessions[session_id]
+
+    def cache_size(self) -> int:
+        return sum(pool.cache_size() for pool in self.pools.values())
+
+    def evict_cache(self) -> None:
+        """
+        Trims the pools in proportion to their size until
+        all caches fit in max_cache_entries.
+        """
+        total = self.cache_size()
+        if total <= self.max_cache_entries:
+            return
+
+        # Trim an extra tenth so eviction doesnt run after every move
+        excess = total - int(self.max_cache_entries * 0.9)
+
+        for pool in self.pools.values():
+            pool.evict(math.ceil(excess * pool.cache_size() / total))
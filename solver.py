@@ -6,13 +6,29 @@ from time import time
 from games.base import Game
 
 class Solver:
-    def __init__(self, verbose=False, max_depth=math.inf):
+    def __init__(
+        self, 
+        verbose=False, 
+        max_depth=math.inf, 
+        tablebase=None, 
+        etc=False,
+        weak=False
+    ):
         self.alphas = dict()
         self.betas = dict()
+
+        # Weak search bounds live apart so they never mix with exact ones
+        self.weak_alphas = dict()
+        self.weak_betas = dict()
+
         self.hit = 0
+        self.tablebase_hits = 0
         self.node_count = 0
         self.verbose = verbose
         self.max_depth = max_depth
+        self.tablebase = tablebase
+        self.etc = etc
+        self.weak = weak
                 
     def negamax(
         self, 
@@ -27,10 +43,38 @@ class Solver:
         if game.is_over():
             return game.compute_final_score()
         
+        # Endgames stored in the tablebase are answered exactly
+        if self.tablebase is not None:
+            tablebase_score = self.tablebase.probe(game)
+            if tablebase_score is not None:
+                self.tablebase_hits += 1
+                return tablebase_score
+        
         # If max depth is reached, return upper or lower bound
         if depth >= self.max_depth:
             return (alpha if game.turn % 2 else beta)
         
+        alphas, betas = (
+            (self.weak_alphas, self.weak_betas) if self.weak else 
+            (self.alphas, self.betas)
+        )
+        
+        # Retrieve cached bounds before the more expensive checks
+        upper_bound = lower_bound = None
+        key = game.get_key()
+        if key is not None:
+            # Single lookups, so entries evicted concurrently are just misses
+            upper_bound = alphas.get(key)
+            if upper_bound is not None:
+                self.hit += 1
+                if upper_bound <= alpha:
+                    return upper_bound
+            lower_bound = betas.get(key)
+            if lower_bound is not None:
+                self.hit += 1
+                if lower_bound >= beta:
+                    return beta
+        
         # Check for immediate win
         immediate_win_score = game.evaluate_immediate_win()
         if immediate_win_score is not None:
@@ -43,18 +87,10 @@ class Solver:
         
         # Compute upper bound since immediate win isn't possible
         # and lower bound since forced loss isn't possible
-        upper_bound = game.get_upper_bound()
-        lower_bound = game.get_lower_bound()
-        
-        # Retrieve cached bounds if possible
-        key = game.get_key()
-        if key is not None:
-            if key in self.alphas:
-                self.hit += 1
-                upper_bound = self.alphas[key]
-            if key in self.betas:
-                self.hit += 1
-                lower_bound = self.betas[key]
+        if upper_bound is None:
+            upper_bound = game.get_upper_bound()
+        if lower_bound is None:
+            lower_bound = game.get_lower_bound()
         
         # Adjust beta based on upper bound
         if beta > upper_bound:
@@ -68,15 +104,31 @@ class Solver:
         if alpha >= beta:
             return beta
         
+        # Enhanced transposition cutoff: a cached upper bound of a child
+        # may already prove a score greater than beta without searching it
+        if self.etc and key is not None:
+            for move in game.legal_moves():
+                game._play_unchecked(move)
+                child_key = game.get_key()
+                game.undo_move()
+
+                child_bound = alphas.get(child_key)
+                if child_bound is not None:
+                    score = -child_bound
+                    if score >= beta:
+                        self.hit += 1
+                        betas[key] = score
+                        return score
+        
         for move in game.legal_moves():
-            game.play_move(move)
+            game._play_unchecked(move)
             score = -self.negamax(game, -beta, -alpha, depth + 1)
             game.undo_move()
 
             # Prune exploration if score is greater than beta   
             if score >= beta:
                 if key is not None:
-                    self.betas[key] = score
+                    betas[key] = score
                 return score
 
             # Reduce window for next exploration
@@ -85,28 +137,34 @@ class Solver:
 
         # Cache the upper bound
         if key is not None:
-            self.alphas[key] = alpha
+            alphas[key] = alpha
 
         return alpha
     
-    def get_best_move(self, game: Game):
-        start_time = time()
-        initial_node_count = self.node_count
-        initial_hit_count = self.hit
-        
+    def solve(self, game: Game) -> tuple[int, int]:
+        """
+        Returns the exact score of the current player and the best move.
+        In weak mode the score is only the outcome: 1 win, 0 draw, -1 loss.
+        """
         best_score = -math.inf
         best_move = None
 
+        # Weak search collapses the window to the outcomes
+        bound = 1 if self.weak else game.max_score
+
         for move in game.legal_moves():
             self.node_count += 1
 
             if self.verbose:
                 print(f'Move: {move}', end=' | ')
 
-            game.play_move(move)
-            score = -self.negamax(game, -game.max_score, game.max_score)
+            game._play_unchecked(move)
+            score = -self.negamax(game, -bound, bound)
             game.undo_move()
 
+            if self.weak:
+                score = (score > 0) - (score < 0)
+
             if self.verbose:
                 print(f'Scored: {score}')
 
@@ -114,6 +172,30 @@ class Solver:
                 best_score = score
                 best_move = move
 
+        return best_score, best_move
+    
+    def get_outcome(self, game: Game) -> int:
+        """
+        Returns the outcome of the current player with a weak search:
+        1 win, 0 draw, -1 loss.
+        """
+        weak, self.weak = self.weak, True
+
+        try:
+            score = self.negamax(game, -1, 1)
+        finally:
+            self.weak = weak
+
+        return (score > 0) - (score < 0)
+    
+    def get_best_move(self, game: Game):
+        start_time = time()
+        initial_node_count = self.node_count
+        initial_hit_count = self.hit
+        initial_tablebase_hits = self.tablebase_hits
+
+        _, best_move = self.solve(game)
+
         search_time = time() - start_time
         nodes_searched = self.node_count - initial_node_count 
         cache_hits = self.hit - initial_hit_count
@@ -121,4 +203,8 @@ class Solver:
         print(f'{nodes_searched} scenarios searched in {search_time:.6f} seconds')
         print(f'Cache hit rate: {cache_hits / nodes_searched * 100:.2f}%')
 
+        if self.tablebase is not None:
+            tablebase_hits = self.tablebase_hits - initial_tablebase_hits
+            print(f'Tablebase hits: {tablebase_hits}')
+
         return best_move
\ No newline at end of file
@@ -0,0 +1,138 @@
+import struct
+from array import array
+from games.dominoes import Dominoes
+
+# Header: magic, number of players, max tiles, key size in bytes, record count
+HEADER = struct.Struct('<4sBBBI')
+MAGIC = b'DTB1'
+
+class EndgameTablebase:
+    """
+    Exact scores of Dominoes endgames with at most max_tiles tiles
+    left in all hands, keyed by Dominoes.get_endgame_key.
+
+    Endgames missing from the table are solved exhaustively the first
+    time they are probed, so the table can be filled offline with build
+    and persisted with save, or simply grown while searching.
+    """
+    def __init__(self, max_tiles: int = 8, n_players: int = 4):
+        self.max_tiles = max_tiles
+        self.n_players = n_players
+        self.scores = dict()
+
+    @property
+    def key_size(self) -> int:
+        return (self.n_players * 28 + 8 + 7) // 8
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def covers(self, game: Dominoes) -> bool:
+        return (
+            game.n_players == self.n_players and
+            len(game.board) > 0 and
+            game.remaining_tiles() <= self.max_tiles
+        )
+
+    def probe(self, game: Dominoes) -> float | None:
+        """
+        Returns the exact score of the current player if the position
+        is within the tablebase, solving it if it wasnt stored yet.
+        """
+        if not self.covers(game):
+            return None
+
+        key = game.get_endgame_key()
+        if key in self.scores:
+            return self.scores[key]
+
+        return self.solve(game)
+
+    def solve(self, game: Dominoes) -> float:
+        """
+        Plain negamax without pruning, so every stored score is exact.
+        """
+        if game.is_over():
+            return game.compute_final_score()
+
+        key = game.get_endgame_key()
+        if key in self.scores:
+            return self.scores[key]
+
+        best_score = -game.max_score
+        for move in game.legal_moves():
+            game._play_unchecked(move)
+            score = -self.solve(game)
+            game.undo_move()
+
+            if score > best_score:
+                best_score = score
+
+        self.scores[key] = best_score
+        return best_score
+
+    def build(self, game: Dominoes) -> int:
+        """
+        Solves every endgame reachable from the current position.
+        Returns the number of stored positions.
+        * Only practical from midgame positions *
+        """
+        if game.is_over():
+            return len(self.scores)
+
+        if self.covers(game):
+            self.probe(game)
+            return len(self.scores)
+
+        for move in game.legal_moves():
+            game._play_unchecked(move)
+            self.build(game)
+            game.undo_move()
+
+        return len(self.scores)
+
+    def save(self, path: str) -> None:
+        key_size = self.key_size
+        scores = array('h', self.scores.values())
+
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(
+                MAGIC,
+                self.n_players,
+                self.max_tiles,
+                key_size,
+                len(self.scores)
+            ))
+
+            f.write(b''.join(
+                key.to_bytes(key_size, 'little')
+                for key in self.scores
+            ))
+            f.write(scores.tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'EndgameTablebase':
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic, n_players, max_tiles, key_size, count = HEADER.unpack_from(data)
+        assert magic == MAGIC, 'Invalid tablebase file'
+
+        tablebase = cls(max_tiles=max_tiles, n_players=n_players)
+        assert tablebase.key_size == key_size, 'Invalid key size'
+
+        keys_start = HEADER.size
+        scores_start = keys_start + count * key_size
+
+        scores = array('h')
+        scores.frombytes(data[scores_start:scores_start + count * scores.itemsize])
+
+        tablebase.scores = {
+            int.from_bytes(data[i:i + key_size], 'little'): score
+            for i, score in zip(
+                range(keys_start, scores_start, key_size),
+                scores
+            )
+        }
+
+        return tablebase